@@ -1,49 +1,35 @@
 //! # Board Module
 //!
 //! This module contains the implementation of the 8-puzzle board and related functionality.
-//! The board is represented as a compact 32-bit integer where each tile position is encoded
-//! using 4 bits, allowing for efficient storage and manipulation.
+//! The board is represented as a compact packed integer where each board position is
+//! encoded using 4 bits, allowing for efficient storage and manipulation.
 //!
 //! ## Board Encoding Strategy
 //!
-//! The key insight is that instead of storing "what number is at each position",
-//! we store "at what position is each number". This allows us to:
+//! The board stores "what number is at each position" as nine packed nibbles
+//! inside a single 64-bit integer (36 bits of payload). This allows us to:
 //!
-//! 1. **Compact Representation**: Use only 32 bits for the entire board state
-//! 2. **Fast Operations**: Bitwise operations for moves and comparisons  
-//! 3. **Implicit Empty Space**: The missing position automatically represents the empty space
+//! 1. **Compact Representation**: A single integer for the entire board state
+//! 2. **Fast Operations**: Moves and lookups are single shift/mask operations
+//! 3. **Direct Lookup**: The tile at any position is read with one shift,
+//!    with no scan over the other tiles
 //!
 //! ### Encoding Details
 //!
-//! - Each tile (1-8) gets 4 bits to store its position (0-8)
-//! - Tile 1's position is stored in bits 0-3
-//! - Tile 2's position is stored in bits 4-7
+//! - Each position (0-8) gets 4 bits to store the tile placed there
+//! - Position 0's tile is stored in bits 0-3
+//! - Position 1's tile is stored in bits 4-7
 //! - And so on...
-//! - The empty space position is found by determining which position (0-8) is not occupied
-//!
-//! ### Example Encoding
-//!
-//! For a solved board:
-//! ```text
-//! 1 2 3
-//! 4 5 6  
-//! 7 8  
-//! ```
-//!
-//! The encoding would be:
-//! - Tile 1 at position 0 → bits 0-3: 0000
-//! - Tile 2 at position 1 → bits 4-7: 0001  
-//! - Tile 3 at position 2 → bits 8-11: 0010
-//! - Tile 4 at position 3 → bits 12-15: 0011
-//! - Tile 5 at position 4 → bits 16-19: 0100
-//! - Tile 6 at position 5 → bits 20-23: 0101
-//! - Tile 7 at position 6 → bits 24-27: 0110
-//! - Tile 8 at position 7 → bits 28-31: 0111
-//! - Empty space at position 8 (implicit)
-//!
-//! This gives us the magic number: `SOLVED_BOARD = 1985229328`
+//! - A nibble holds the tile's display value (1-8), with 0 marking the empty space
+//! - The empty space position is additionally cached alongside the encoding
+//!   and kept in sync on every move, so it never has to be searched for
 
-use std::{cmp::Ordering, fmt::Display, sync::LazyLock};
+use std::{
+    cmp::Ordering,
+    fmt::Display,
+    hash::{Hash, Hasher},
+    sync::LazyLock,
+};
 
 use colored::Colorize;
 use rand::{rng, seq::IndexedRandom};
@@ -60,8 +46,51 @@ const SOLVED_BOARD: [u8; BOARD_AREA as usize] = [
     7, 6, 5
 ];
 
-/// The solved board state represented as a 32-bit integer
-static SOLVED_BOARD_ENCODED: LazyLock<u32> = LazyLock::new(|| Board::from_arr(&SOLVED_BOARD).0);
+/// The solved board state
+///
+/// Evaluated at compile time straight from [`SOLVED_BOARD`]: the packed
+/// encoding and space position are constants, and every tile is in place so
+/// the cached heuristic is zero. `is_solved` therefore compares against an
+/// immediate instead of touching lazily initialized state.
+const SOLVED_BOARD_STATE: Board = {
+    let mut tiles: u64 = 0;
+    let mut space: u8 = 0;
+
+    let mut pos = 0;
+    while pos < BOARD_AREA {
+        let val = SOLVED_BOARD[pos as usize];
+        tiles |= (val as u64) << (TILE_BIT_SIZE * pos);
+        if val == 0 {
+            space = pos;
+        }
+        pos += 1;
+    }
+
+    Board {
+        tiles,
+        space,
+        heuristic: 0,
+    }
+};
+
+/// Precomputed legal moves for each possible space position
+///
+/// `MOVES[p]` lists every `(direction, destination)` pair that is reachable
+/// when the empty space sits at position `p`. There are only nine space
+/// positions and at most four directions, so the whole table is built once
+/// at first use; the solver's expansion loop can then iterate valid moves
+/// directly instead of trying all four directions and discarding failures.
+pub static MOVES: LazyLock<[Vec<(Direction, u8)>; BOARD_AREA as usize]> = LazyLock::new(|| {
+    std::array::from_fn(|p| {
+        let p = p.try_into().expect("Should be less than 256");
+
+        ALL_DIRECTIONS
+            .into_iter()
+            .filter(|&direction| Board::is_valid_movement(p, direction))
+            .map(|direction| (direction, Board::calculate_new_position(p, direction)))
+            .collect()
+    })
+});
 
 /// The side length of the square board (3x3 grid)
 const BOARD_SIDE: u8 = 3;
@@ -72,6 +101,56 @@ const BOARD_AREA: u8 = BOARD_SIDE * BOARD_SIDE;
 /// Number of bits used to represent each tile position
 const TILE_BIT_SIZE: u8 = 4;
 
+/// Mask covering a single tile field (`0b1111`)
+const TILE_NIBBLE_MASK: u8 = (1 << TILE_BIT_SIZE) - 1;
+
+/// Manhattan distance between every pair of board positions
+///
+/// With only 81 `(from, to)` pairs the whole table is evaluated at compile
+/// time, so each term of the heuristic is a plain array lookup instead of
+/// row/column arithmetic.
+const MANHATTAN_DISTANCE: [[u8; BOARD_AREA as usize]; BOARD_AREA as usize] = {
+    let mut table = [[0; BOARD_AREA as usize]; BOARD_AREA as usize];
+
+    let mut pos1 = 0;
+    while pos1 < BOARD_AREA {
+        let mut pos2 = 0;
+        while pos2 < BOARD_AREA {
+            table[pos1 as usize][pos2 as usize] = Board::manhattan_distance(pos1, pos2);
+            pos2 += 1;
+        }
+        pos1 += 1;
+    }
+
+    table
+};
+
+/// Position of each tile (0-7 internally) in the solved board
+///
+/// Precomputed so the heuristic never has to construct a solved board or
+/// decode its tile fields.
+const SOLVED_TILE_POSITIONS: [u8; (BOARD_AREA - 1) as usize] = {
+    let mut table = [0; (BOARD_AREA - 1) as usize];
+
+    let mut pos = 0;
+    while pos < BOARD_AREA {
+        let val = SOLVED_BOARD[pos as usize];
+        if val != 0 {
+            table[(val - 1) as usize] = pos;
+        }
+        pos += 1;
+    }
+
+    table
+};
+
+/// The raw packed encoding of a board state.
+///
+/// The solver keys its hash maps and sets by this integer directly instead
+/// of by `Board` values, so bookkeeping structures store the minimal state
+/// and a full `Board` is only rebuilt when reconstructing the solution path.
+pub(crate) type EncodedBoard = u64;
+
 /// Represents the four possible directions for moving tiles in the puzzle
 #[derive(Clone, Copy)]
 pub enum Direction {
@@ -87,49 +166,71 @@ pub enum Direction {
 
 /// Represents an 8-puzzle board state
 ///
-/// ## Compact 32-bit Encoding
+/// ## Compact Packed Encoding
 ///
-/// The board is stored as a compact 32-bit integer where each tile's position
-/// is encoded using 4 bits. This representation is based on the insight that
-/// instead of storing "what tile is at each position", we store "at what position
-/// is each tile".
+/// The board is stored as nine packed nibbles inside a 64-bit integer, one
+/// per board position, each holding the tile placed there.
 ///
 /// ### Why This Encoding?
 ///
-/// 1. **Memory Efficient**: Only 32 bits instead of 36+ bytes for arrays
+/// 1. **Memory Efficient**: 36 payload bits instead of 36+ bytes for arrays
 /// 2. **Copy Efficient**: Single integer copy instead of array copy
 /// 3. **Hash Friendly**: Perfect for HashMap/HashSet keys
-/// 4. **Cache Friendly**: Fits in a single cache line
-/// 5. **Implicit Empty Space**: No need to explicitly track empty position
+/// 4. **Direct Lookup**: The tile at any position is one shift and mask away
+/// 5. **Cached Empty Space**: The space position rides along with the
+///    encoding so moves never have to search for it
 ///
 /// ### Bit Layout
 ///
 /// ```text
-/// Bits:  31-28  27-24  23-20  19-16  15-12  11-8   7-4    3-0
-/// Tile:    8      7      6      5      4     3      2      1
-/// Value: pos8   pos7   pos6   pos5   pos4  pos3   pos2   pos1
+/// Bits:  35-32  31-28  27-24  23-20  19-16  15-12  11-8   7-4    3-0
+/// Pos:     8      7      6      5      4      3      2     1      0
+/// Value: tile8  tile7  tile6  tile5  tile4  tile3  tile2  tile1  tile0
 /// ```
 ///
-/// Each 4-bit field stores the position (0-8) where that tile is located.
+/// Each 4-bit field stores the display value (1-8) of the tile at that
+/// position, with 0 marking the empty space.
 ///
 /// ### Example: Solved State
 ///
 /// ```text
-/// Board Layout:     Binary Encoding:
-/// 1 2 3            Tile 1 at pos 0: 0000
-/// 4 5 6            Tile 2 at pos 1: 0001
-/// 7 8               Tile 3 at pos 2: 0010
-///                  Tile 4 at pos 3: 0011
-/// Positions:       Tile 5 at pos 4: 0100
-/// 0 1 2            Tile 6 at pos 5: 0101
-/// 3 4 5            Tile 7 at pos 6: 0110
-/// 6 7 8            Tile 8 at pos 7: 0111
-///                  Empty at pos 8:  (implicit)
+/// Board Layout:     Nibble Encoding:
+/// 1 2 3            Position 0 holds 1: 0001
+/// 8   4            Position 1 holds 2: 0010
+/// 7 6 5            Position 2 holds 3: 0011
+///                  Position 3 holds 8: 1000
+/// Positions:       Position 4 (space): 0000
+/// 0 1 2            Position 5 holds 4: 0100
+/// 3 4 5            Position 6 holds 7: 0111
+/// 6 7 8            Position 7 holds 6: 0110
+///                  Position 8 holds 5: 0101
 /// ```
-///
-/// This produces: `0111_0110_0101_0100_0011_0010_0001_0000` = 1985229328
-#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
-pub struct Board(u32);
+#[derive(Clone, Copy, Debug)]
+pub struct Board {
+    /// Packed position→tile encoding (see the bit layout above)
+    tiles: u64,
+    /// Cached position of the empty space, kept in sync with `tiles`
+    space: u8,
+    /// Cached Manhattan-distance heuristic, updated incrementally on moves
+    heuristic: u8,
+}
+
+/// Equality considers only the packed encoding; the cached space position
+/// and heuristic are derived from it and carry no extra information.
+impl PartialEq for Board {
+    fn eq(&self, other: &Self) -> bool {
+        self.tiles == other.tiles
+    }
+}
+
+impl Eq for Board {}
+
+/// Hashing mirrors equality: only the packed encoding participates.
+impl Hash for Board {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        self.tiles.hash(state);
+    }
+}
 
 impl Board {
     /// Generates a random board by performing random moves from the solved state
@@ -137,6 +238,10 @@ impl Board {
     /// This ensures that the generated board is always solvable, as it's created
     /// by scrambling the solved state with valid moves.
     ///
+    /// Each step picks uniformly among the legal moves from the precomputed
+    /// [`MOVES`] table, so no step is wasted on an invalid direction and the
+    /// scramble never goes through the validating move path.
+    ///
     /// # Arguments
     ///
     /// * `steps` - Number of random moves to perform for scrambling
@@ -149,13 +254,11 @@ impl Board {
         let mut rng = rng();
 
         for _ in 0..steps {
-            let direction = *ALL_DIRECTIONS
+            let &(_, destination) = MOVES[usize::from(board.space_position())]
                 .choose(&mut rng)
-                .expect("This should never happen");
+                .expect("Every space position has at least two legal moves");
 
-            if let Ok(b) = board.move_space(direction) {
-                board = b;
-            }
+            board = board.move_space_to(destination);
         }
 
         board
@@ -163,49 +266,20 @@ impl Board {
 
     /// Converts the compact board representation to a 2D array format
     ///
-    /// This function reverses the encoding process: instead of storing where each
-    /// tile is located, it reconstructs what tile is at each position.
-    ///
-    /// ## Algorithm
-    ///
-    /// 1. Initialize array with zeros (empty positions)
-    /// 2. For each tile (1-8):
-    ///    - Extract its position from the 4-bit field
-    ///    - Place the tile number at that position in the array
-    /// 3. Position 8 remains 0 (empty space) if not occupied
-    ///
-    /// ## Example
-    ///
-    /// For encoded value `1985229328`:
-    /// ```text
-    /// Tile 1 → Extract bits 0-3:   0000 = position 0
-    /// Tile 2 → Extract bits 4-7:   0001 = position 1  
-    /// Tile 3 → Extract bits 8-11:  0010 = position 2
-    /// ...
-    /// Result: [1, 2, 3, 4, 5, 6, 7, 8, 0]
-    /// ```
+    /// The encoding already stores what tile is at each position, so this is
+    /// a straight unpack of the nine nibbles into an array.
     ///
     /// # Returns
     ///
     /// A 9-element array where each position contains the tile number,
     /// with 0 representing the empty space
     fn into_arr(self) -> [u8; BOARD_AREA as usize] {
-        let mut arr = [0; BOARD_AREA as usize];
-
-        // For each tile (0-7 representing tiles 1-8)
-        for val in 0..(BOARD_AREA - 1) {
-            // Extract the 4-bit position field for this tile
-            let pos = self.get_pos(val);
-            // Place the tile number (val + 1) at its encoded position
-            arr[pos as usize] = val + 1;
-        }
-
-        arr
+        std::array::from_fn(|pos| self.nibble(pos.try_into().expect("Should be less than 256")))
     }
 
     /// Creates a board from a 2D array representation
     ///
-    /// This function encodes the array format back into the compact 32-bit representation.
+    /// This function encodes the array format back into the compact packed representation.
     /// It assumes that the input array is valid (contains numbers 0-8 with no duplicates).
     ///
     /// # Arguments
@@ -216,24 +290,57 @@ impl Board {
     ///
     /// The encoded `Board` instance
     pub fn from_arr(arr: &[u8; BOARD_AREA as usize]) -> Self {
-        let mut board = Board(0);
+        let space = arr
+            .iter()
+            .position(|&val| val == 0)
+            .expect("Board must contain an empty space")
+            .try_into()
+            .expect("Should be less than 256");
+
+        let mut board = Board {
+            tiles: 0,
+            space,
+            heuristic: 0,
+        };
 
         for (pos, &val) in arr.iter().enumerate() {
-            if val != 0 {
-                board.set_value(pos.try_into().expect("Should be less than 256"), val - 1);
-            }
+            board.tiles |= u64::from(val) << (TILE_BIT_SIZE as usize * pos);
         }
 
+        board.heuristic = board.compute_heuristic();
         board
     }
 
+    /// Returns the raw packed encoding, suitable for use as a hash key
+    #[inline]
+    pub(crate) fn encoded(self) -> EncodedBoard {
+        self.tiles
+    }
+
+    /// Rebuilds a full board (including its cached fields) from a raw encoding
+    ///
+    /// This is the inverse of [`Board::encoded`] and is only needed on cold
+    /// paths such as solution-path reconstruction.
+    pub(crate) fn from_encoded(tiles: EncodedBoard) -> Self {
+        let mut arr = [0; BOARD_AREA as usize];
+
+        for (pos, slot) in arr.iter_mut().enumerate() {
+            *slot = ((tiles >> (TILE_BIT_SIZE as usize * pos)) & u64::from(TILE_NIBBLE_MASK))
+                .try_into()
+                .expect("TILE_BIT_SIZE should be less than 8");
+        }
+
+        Self::from_arr(&arr)
+    }
+
     /// Checks if the board is in the solved state
     ///
     /// # Returns
     ///
     /// `true` if the board is solved (tiles are in numerical order), `false` otherwise
+    #[inline]
     pub fn is_solved(self) -> bool {
-        self.0 == *SOLVED_BOARD_ENCODED
+        self.tiles == SOLVED_BOARD_STATE.tiles
     }
 
     /// Validates if a movement is possible from a given position
@@ -255,52 +362,26 @@ impl Board {
         }
     }
 
-    /// Finds the current position of the empty space on the board
-    ///
-    /// Since we only store positions for tiles 1-8, the empty space is implicitly
-    /// the position that's NOT occupied by any tile.
-    ///
-    /// ## Algorithm
-    ///
-    /// 1. Create a bitmask representing all occupied positions
-    /// 2. For each tile, set the bit corresponding to its position
-    /// 3. Find the first unset bit (0-8) - this is the empty space
+    /// Returns the current position of the empty space on the board
     ///
-    /// ## Example
-    ///
-    /// If tiles occupy positions [0,1,2,3,4,5,6,7]:
-    /// ```text
-    /// Bitmask: 011111111 (positions 0-7 occupied)
-    /// Missing: position 8 → empty space at position 8
-    /// ```
-    ///
-    /// ## Why This Works
-    ///
-    /// - We have 9 positions (0-8) and 8 tiles
-    /// - Each tile occupies exactly one position  
-    /// - The unoccupied position is where the empty space is
-    /// - `trailing_ones()` finds the first 0 bit, which is our answer
+    /// The space position is computed once at construction time and updated
+    /// incrementally on every move, so this is a plain field read rather than
+    /// a scan over the tile encoding.
     ///
     /// # Returns
     ///
     /// The position (0-8) of the empty space
-    fn find_space_position(self) -> u8 {
-        let mut idx: u32 = 0;
-
-        // Build bitmask of occupied positions
-        for val in 0..(BOARD_AREA - 1) {
-            let pos = self.get_pos(val);
-            idx |= 1 << pos; // Set bit at position 'pos'
-        }
-
-        // Find first unset bit (empty position)
-        idx.trailing_ones()
-            .try_into()
-            .expect("Should be less than 256")
+    #[inline]
+    pub(crate) fn space_position(self) -> u8 {
+        self.space
     }
 
     /// Calculates the new position after moving in a specific direction
     ///
+    /// The move must already be known valid (see [`Board::is_valid_movement`]);
+    /// this is only called while building the [`MOVES`] table, which filters
+    /// out invalid directions first, so no fallible path is needed.
+    ///
     /// # Arguments
     ///
     /// * `from` - The current position (0-8)
@@ -308,40 +389,17 @@ impl Board {
     ///
     /// # Returns
     ///
-    /// `Ok(new_position)` if the move is valid, or an error message if invalid
-    fn calculate_new_position(from: u8, direction: Direction) -> Result<u8, &'static str> {
-        if !Board::is_valid_movement(from, direction) {
-            return Err("Invalid move: cannot move space in that direction");
-        }
-
-        Ok(match direction {
+    /// The position reached by moving one step in the given direction
+    fn calculate_new_position(from: u8, direction: Direction) -> u8 {
+        match direction {
             Up => from - BOARD_SIDE,
             Down => from + BOARD_SIDE,
             Left => from - 1,
             Right => from + 1,
-        })
+        }
     }
 
-    /// Gets the tile value at a specific position
-    ///
-    /// This function searches through all tiles to find which one is located
-    /// at the specified position. It's essentially the inverse of the encoding.
-    ///
-    /// ## Algorithm
-    ///
-    /// 1. Iterate through all tiles (1-8, represented as 0-7 internally)
-    /// 2. For each tile, extract its encoded position
-    /// 3. If the position matches what we're looking for, return the tile number
-    /// 4. If no tile is found at that position, it means the position is empty
-    ///
-    /// ## Example
-    ///
-    /// To find what's at position 2:
-    /// ```text
-    /// Check tile 1: position = bits 0-3   → if == 2, return 0 (tile 1)
-    /// Check tile 2: position = bits 4-7   → if == 2, return 1 (tile 2)  
-    /// Check tile 3: position = bits 8-11  → if == 2, return 2 (tile 3) ✓
-    /// ```
+    /// Reads the raw 4-bit field at a position
     ///
     /// # Arguments
     ///
@@ -349,115 +407,78 @@ impl Board {
     ///
     /// # Returns
     ///
-    /// The tile number (0-7 representing tiles 1-8) at the specified position
-    ///
-    /// # Panics
-    ///
-    /// Panics if the position doesn't contain a valid tile (i.e., it's the empty space)
-    fn get_value(self, p: u8) -> u8 {
-        let mut target_val = 0;
-        let mut target_pos = 0;
-
-        // Search through all tiles to find which one is at position 'p'
-        for val in 0..(BOARD_AREA - 1) {
-            target_val = val;
-            target_pos = self.get_pos(val);
-            if target_pos == p {
-                break; // Found the tile at position 'p'
-            }
-        }
-
-        assert!(
-            target_pos == p,
-            "Invalid move: cannot move space in that direction"
-        );
-
-        target_val // Return tile number (0-7)
+    /// The display value (1-8) of the tile at the position, or 0 for the empty space
+    #[inline]
+    fn nibble(self, p: u8) -> u8 {
+        (self.tiles.unbounded_shr(u32::from(TILE_BIT_SIZE * p)) % (1 << TILE_BIT_SIZE))
+            .try_into()
+            .expect("TILE_BIT_SIZE should be less than 8")
     }
 
-    /// Sets a tile value at a specific position in the compact representation
-    ///
-    /// This function updates the encoding to move a tile to a new position.
-    /// It modifies the 4-bit field corresponding to the specified tile.
-    ///
-    /// ## Algorithm
-    ///
-    /// 1. Create a mask to clear the old position for tile `val`
-    /// 2. Clear the 4-bit field for tile `val` using bitwise AND with inverted mask
-    /// 3. Set the new position using bitwise OR
+    /// Moves the empty space directly to an adjacent position
     ///
-    /// ## Example
+    /// This effectively moves a tile into the empty space, creating a new
+    /// board state; the operation is performed on a copy of the board,
+    /// leaving the original unchanged. The destination must be adjacent to
+    /// the current space position, as guaranteed by entries of the
+    /// precomputed [`MOVES`] table.
     ///
-    /// To move tile 3 (val=2) to position 5 (p=5):
-    /// ```text
-    /// 1. Create mask for bits 8-11:  mask = 1111_0000_0000
-    /// 2. Clear old position:         board &= !mask
-    /// 3. Set new position:           board |= (5 << 8)
-    /// ```
+    /// The whole move is a handful of 64-bit integer operations: the space's
+    /// nibble is zero, so XOR-ing the moved tile's value into both fields
+    /// clears the destination and fills the vacated position in one update,
+    /// with no mask-out step.
     ///
-    /// ## Bit Operations Breakdown
+    /// # Arguments
     ///
-    /// - `(1 << TILE_BIT_SIZE) - 1` creates mask `1111`
-    /// - `mask << (TILE_BIT_SIZE * val)` positions the mask at tile's field
-    /// - `&= !mask` clears the old value
-    /// - `|= p << (TILE_BIT_SIZE * val)` sets the new position
+    /// * `space_new_position` - The position the empty space moves to
     ///
-    /// # Arguments
+    /// # Returns
     ///
-    /// * `p` - The position to place the tile at (0-8)
-    /// * `val` - The tile number (0-7 representing tiles 1-8) to place
-    fn set_value(&mut self, p: u8, val: u8) {
-        // Create 4-bit mask: 0000_1111
-        let ones = (1 << TILE_BIT_SIZE) - 1;
-        // Position mask at tile's bit field
-        let mask = ones << (TILE_BIT_SIZE * val);
-        // Clear old position
-        self.0 &= !mask;
-        // Set new position
-        self.0 |= u32::from(p) << (TILE_BIT_SIZE * val);
+    /// The board state after the move
+    #[inline]
+    pub(crate) fn move_space_to(mut self, space_new_position: u8) -> Self {
+        let space_position = self.space_position();
+        let tile = self.nibble(space_new_position);
+        debug_assert!(tile != 0, "Destination must hold a tile, not the space");
+
+        self.tiles ^= (u64::from(tile) << (TILE_BIT_SIZE * space_new_position))
+            | (u64::from(tile) << (TILE_BIT_SIZE * space_position));
+        self.space = space_new_position;
+
+        // Only the moved tile's contribution to the heuristic changes:
+        // add its distance from the new position, drop the old one.
+        let solved_pos = usize::from(SOLVED_TILE_POSITIONS[usize::from(tile - 1)]);
+        self.heuristic = self.heuristic
+            + MANHATTAN_DISTANCE[solved_pos][usize::from(space_position)]
+            - MANHATTAN_DISTANCE[solved_pos][usize::from(space_new_position)];
+
+        self
     }
 
-    /// Moves the empty space in the specified direction
-    ///
-    /// This effectively moves a tile into the empty space, creating a new board state.
-    /// The operation is performed on a copy of the board, leaving the original unchanged.
-    ///
-    /// # Arguments
+    /// Estimates the heuristic distance to the solution using Manhattan distance
     ///
-    /// * `direction` - The direction to move the empty space
+    /// The value is the sum of the Manhattan distances of each tile from its
+    /// target position in the solved state (the empty space is not counted).
+    /// It is computed once at construction and maintained incrementally by
+    /// [`Board::move_space_to`], so this is a plain field read.
     ///
     /// # Returns
     ///
-    /// `Ok(new_board)` if the move is valid, or an error message if the move is invalid
-    pub fn move_space(mut self, direction: Direction) -> Result<Self, &'static str> {
-        let space_position = self.find_space_position();
-        let space_new_position = Self::calculate_new_position(space_position, direction)?;
-        let digit_to_move = self.get_value(space_new_position);
-
-        self.set_value(space_position, digit_to_move);
-
-        Ok(self)
-    }
-
-    fn get_pos(self, value: u8) -> u8 {
-        let offset = TILE_BIT_SIZE * value;
-        (self.0.unbounded_shr(u32::from(offset)) % (1 << TILE_BIT_SIZE))
-            .try_into()
-            .expect("TILE_BIT_SIZE should be less than 8")
+    /// The total Manhattan distance as a `u8` value, representing how far
+    /// the board is from the solved state.
+    #[inline]
+    pub fn heuristic_distance_to_solution(self) -> u8 {
+        self.heuristic
     }
 
-    /// Estimates the heuristic distance to the solution using Manhattan distance
-    ///
-    /// This function calculates the sum of the Manhattan distances for each tile
-    /// from its current position to its target position in the solved state.
-    /// The empty space is not included in this calculation.
+    /// Computes the Manhattan-distance heuristic from scratch
     ///
     /// ## Algorithm
     ///
-    /// 1. For each tile (1-8):
-    ///    - Get its current position
-    ///    - Get its target position from the solved state
-    ///    - Calculate the Manhattan distance between these two positions
+    /// 1. For each position (0-8):
+    ///    - Read the tile stored there (skipping the empty space)
+    ///    - Look up its solved position in [`SOLVED_TILE_POSITIONS`]
+    ///    - Look up the distance between the two in [`MANHATTAN_DISTANCE`]
     /// 2. Sum all individual distances to get the total heuristic distance
     ///
     /// ## Example
@@ -469,22 +490,23 @@ impl Board {
     /// Total heuristic distance = 0 + 2 + ...
     /// ```
     ///
-    /// # Returns
-    ///
-    /// The total Manhattan distance as a `u8` value, representing how far
-    /// the board is from the solved state.
-    pub fn heuristic_distance_to_solution(self) -> u8 {
-        let solution = Self::default();
+    /// Only used to seed the cached value at construction time; moves keep
+    /// the cache current with a single-tile delta.
+    fn compute_heuristic(self) -> u8 {
         let mut distance = 0;
 
-        for val in 0..(BOARD_AREA - 1) {
-            distance += Self::manhattan_distance(solution.get_pos(val), self.get_pos(val));
+        for pos in 0..BOARD_AREA {
+            let nibble = self.nibble(pos);
+            if nibble != 0 {
+                distance += MANHATTAN_DISTANCE
+                    [usize::from(SOLVED_TILE_POSITIONS[usize::from(nibble - 1)])][usize::from(pos)];
+            }
         }
 
         distance
     }
 
-    fn manhattan_distance(pos1: u8, pos2: u8) -> u8 {
+    const fn manhattan_distance(pos1: u8, pos2: u8) -> u8 {
         let hdis = (pos2 % BOARD_SIDE).abs_diff(pos1 % BOARD_SIDE);
         let vdis = (pos2 / BOARD_SIDE).abs_diff(pos1 / BOARD_SIDE);
 
@@ -508,7 +530,7 @@ impl Ord for Board {
 /// Default implementation creates a solved board state
 impl Default for Board {
     fn default() -> Self {
-        Board(*SOLVED_BOARD_ENCODED)
+        SOLVED_BOARD_STATE
     }
 }
 
@@ -519,7 +541,7 @@ impl Default for Board {
 impl Display for Board {
     fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
         let arr = self.into_arr().into_iter();
-        let target = Board::default().into_arr().into_iter();
+        let target = SOLVED_BOARD.into_iter();
 
         for (i, (val, is_in_position)) in arr.zip(target).map(|(a, t)| (a, a == t)).enumerate() {
             if i % BOARD_SIDE as usize == 0 && i != 0 {
@@ -544,20 +566,107 @@ impl Display for Board {
 
 /// Board annotated with the number of steps taken to reach it (g-cost).
 ///
-/// When ordered, it uses `heuristic_distance_to_solution() + steps` which
-/// allows a priority queue to behave like A* with an admissible heuristic.
-#[derive(PartialEq, Eq, Default, Clone)]
-pub struct BoardWithSteps(pub Board, pub usize);
+/// The total cost `f(n) = g(n) + h(n)` is materialized once at
+/// construction, and the derived ordering compares it first, which allows
+/// a priority queue to behave like A* with an admissible heuristic while
+/// every heap comparison stays a plain integer compare.
+///
+/// `previous_space` records where the space was before the move that
+/// produced this node (`None` for the root). Expanding that position again
+/// would just regenerate the parent, so the solver skips it.
+#[derive(PartialEq, Eq, PartialOrd, Ord, Default, Clone)]
+pub struct BoardWithSteps {
+    /// Total estimated cost `f(n) = g(n) + h(n)`, the primary sort key
+    pub cost: usize,
+    /// Number of steps taken from the start to reach this board (g-cost)
+    pub steps: usize,
+    /// The board state itself
+    pub board: Board,
+    /// Space position before the move that produced this node
+    pub previous_space: Option<u8>,
+}
 
-impl PartialOrd for BoardWithSteps {
-    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
-        Some(self.cmp(other))
+/// Bit offsets for [`BoardWithSteps::pack`]: the packed tiles occupy the low
+/// 36 bits, followed by the space position, the previous-space nibble, the
+/// step count, and finally the cost in the most significant bits — so the
+/// natural integer order of packed words matches the node order.
+const PACKED_SPACE_SHIFT: u32 = 36;
+const PACKED_PREVIOUS_SHIFT: u32 = 40;
+const PACKED_STEPS_SHIFT: u32 = 44;
+const PACKED_COST_SHIFT: u32 = 52;
+
+/// Sentinel in the previous-space nibble marking the root node
+const PACKED_NO_PREVIOUS: u64 = 0xF;
+
+impl BoardWithSteps {
+    /// Builds a frontier node, materializing its total cost up front
+    pub fn new(board: Board, steps: usize, previous_space: Option<u8>) -> Self {
+        Self {
+            cost: usize::from(board.heuristic_distance_to_solution()) + steps,
+            steps,
+            board,
+            previous_space,
+        }
     }
-}
 
-impl Ord for BoardWithSteps {
-    fn cmp(&self, other: &Self) -> Ordering {
-        (self.0.heuristic_distance_to_solution() as usize + self.1)
-            .cmp(&(other.0.heuristic_distance_to_solution() as usize + other.1))
+    /// Packs the whole node into a single machine word
+    ///
+    /// The cost sits in the most significant bits, so comparing two packed
+    /// words orders nodes exactly like comparing the nodes themselves (up to
+    /// tie-breaking among equal-cost entries). A binary heap of packed words
+    /// therefore sifts with single integer compares and single-word swaps.
+    ///
+    /// Cost and steps must fit in 8 bits each; with the admissible Manhattan
+    /// heuristic and duplicate pruning both stay well below that bound.
+    ///
+    /// # Panics
+    ///
+    /// Panics if the cost or step count does not fit in its 8-bit field.
+    pub(crate) fn pack(&self) -> u64 {
+        let previous = self.previous_space.map_or(PACKED_NO_PREVIOUS, u64::from);
+        let steps = u64::from(u8::try_from(self.steps).expect("Steps fit in 8 bits"));
+        let cost = u64::from(u8::try_from(self.cost).expect("Cost fits in 8 bits"));
+
+        self.board.tiles
+            | (u64::from(self.board.space) << PACKED_SPACE_SHIFT)
+            | (previous << PACKED_PREVIOUS_SHIFT)
+            | (steps << PACKED_STEPS_SHIFT)
+            | (cost << PACKED_COST_SHIFT)
+    }
+
+    /// Rebuilds a node from its packed form
+    ///
+    /// The board's cached fields come straight out of the word: the space
+    /// position is stored explicitly and the heuristic is recovered as
+    /// `cost - steps`, so no decoding pass over the tiles is needed.
+    pub(crate) fn unpack(word: u64) -> Self {
+        let steps: usize = ((word >> PACKED_STEPS_SHIFT) & 0xFF)
+            .try_into()
+            .expect("Steps fit in 8 bits");
+        let cost: usize = (word >> PACKED_COST_SHIFT)
+            .try_into()
+            .expect("Cost fits in 8 bits");
+
+        let board = Board {
+            tiles: word & ((1 << PACKED_SPACE_SHIFT) - 1),
+            space: ((word >> PACKED_SPACE_SHIFT) & u64::from(TILE_NIBBLE_MASK))
+                .try_into()
+                .expect("Space position fits in 4 bits"),
+            heuristic: (cost - steps).try_into().expect("Heuristic fits in 8 bits"),
+        };
+
+        let previous = (word >> PACKED_PREVIOUS_SHIFT) & u64::from(TILE_NIBBLE_MASK);
+        let previous_space = if previous == PACKED_NO_PREVIOUS {
+            None
+        } else {
+            Some(previous.try_into().expect("Position fits in 4 bits"))
+        };
+
+        Self {
+            cost,
+            steps,
+            board,
+            previous_space,
+        }
     }
 }
@@ -1,8 +1,9 @@
 //! # O8 - 8-Puzzle Solver
 //!
 //! A high-performance 8-puzzle solver that compares multiple search strategies
-//! (Depth-First Search, Breadth-First Search, and a heuristic best-first/A*-style search)
-//! with parallel benchmarking and rich statistics.
+//! (Depth-First Search, Breadth-First Search, a heuristic best-first/A*-style
+//! search, and Iterative Deepening A*) with parallel benchmarking and rich
+//! statistics.
 //!
 //! The 8-puzzle is a sliding puzzle consisting of a 3×3 grid with 8 numbered tiles and one empty space.
 //! The goal is to arrange the tiles in numerical order by sliding them into the empty space.
@@ -21,17 +22,15 @@ use clap::Parser;
 use clap::Subcommand;
 use clap::ValueEnum;
 use indicatif::ParallelProgressIterator;
-use indicatif::ProgressIterator;
 use rayon::ThreadPoolBuilder;
-use rayon::iter::{IntoParallelRefIterator, ParallelIterator};
+use rayon::iter::{IntoParallelIterator, IntoParallelRefIterator, ParallelIterator};
 
-use crate::board::BoardWithSteps;
+use crate::search_strategies::BfsSearchStrategy;
+use crate::search_strategies::DfsSearchStrategy;
 use crate::search_strategies::HeuristicSearchStrategy;
-use crate::search_strategies::SearchStrategy;
-use crate::search_strategies::SimpleSearchStrategy;
 use crate::{
     board::Board,
-    solver::{ExplorerStrategy, Solver},
+    solver::{IdaStarSolver, PuzzleSolver, Solver},
     stats::{Stats, print_comparison_table, print_run_stats},
 };
 
@@ -56,6 +55,8 @@ enum SolveAlgorithm {
     /// Heuristic Search: uses a heuristic to prioritize paths that seem most promising
     #[default]
     Heuristic,
+    /// Iterative Deepening A*: repeated depth-first probes with increasing cost bounds
+    IdaStar,
 }
 
 /// Command-line arguments for the 8-puzzle solver
@@ -96,14 +97,14 @@ enum Commands {
 /// # Arguments
 ///
 /// * `boards` - A slice of puzzle boards to solve
-/// * `solver` - A configured `Solver` with the chosen strategy
+/// * `solver` - A configured solver, cloned fresh for each board
 ///
 /// # Returns
 ///
 /// A vector of statistics for each solved board
-fn run_search<T>(boards: &[Board], solver: &Solver<T>) -> Vec<Stats>
+fn run_search<S>(boards: &[Board], solver: &S) -> Vec<Stats>
 where
-    T: SearchStrategy<board::BoardWithSteps> + Default + Send + Sync + Clone,
+    S: PuzzleSolver + Clone + Send + Sync,
 {
     boards
         .par_iter()
@@ -130,36 +131,33 @@ fn benchmark(runs: usize, scramble_steps: usize, threads: Option<usize>) {
         "Generating {runs} random boards with {scramble_steps} moves and comparing strategies..."
     );
 
+    // Scrambling is independent per board, so generation parallelizes just
+    // like solving and honors the same thread pool.
     let boards: Vec<Board> = (0..runs)
+        .into_par_iter()
         .progress()
         .map(|_| Board::random_with_solution(scramble_steps))
         .collect();
 
     println!("Running DFS...");
-    let dfs_run = run_search(
-        &boards,
-        &Solver::new(SimpleSearchStrategy::new(ExplorerStrategy::Dfs)),
-    );
+    let dfs_run = run_search(&boards, &Solver::new(DfsSearchStrategy::default()));
     println!("Running BFS...");
-    let bfs_run = run_search(
-        &boards,
-        &Solver::new(SimpleSearchStrategy::new(ExplorerStrategy::Bfs)),
-    );
+    let bfs_run = run_search(&boards, &Solver::new(BfsSearchStrategy::default()));
     println!("Running Heuristic Search (A*-style) ...");
     let etc = run_search(&boards, &Solver::new(HeuristicSearchStrategy::default()));
-
-    print_comparison_table(
-        &dfs_run.as_slice().into(),
-        &bfs_run.as_slice().into(),
-        &etc.as_slice().into(),
-    );
+    println!("Running IDA*...");
+    let ida_run = run_search(&boards, &IdaStarSolver::default());
+
+    print_comparison_table(&[
+        ("DFS", dfs_run.as_slice().into()),
+        ("BFS", bfs_run.as_slice().into()),
+        ("Heuristic", etc.as_slice().into()),
+        ("IDA*", ida_run.as_slice().into()),
+    ]);
 }
 
 /// Solve a single board and print the path and per-step heuristic
-fn solve_one<T>(board: Board, mut solver: Solver<T>)
-where
-    T: SearchStrategy<BoardWithSteps> + Clone + Default,
-{
+fn solve_one(board: Board, mut solver: impl PuzzleSolver) {
     solver.solve(board).expect("No solution found");
     let solution = solver.step_by_step_solution();
 
@@ -191,21 +189,17 @@ fn solve_random(scramble_steps: usize, algo: SolveAlgorithm) {
             SolveAlgorithm::Dfs => "DFS",
             SolveAlgorithm::Bfs => "BFS",
             SolveAlgorithm::Heuristic => "Heuristic",
+            SolveAlgorithm::IdaStar => "IDA*",
         }
     );
 
     match algo {
-        SolveAlgorithm::Dfs => solve_one(
-            board,
-            Solver::new(SimpleSearchStrategy::new(ExplorerStrategy::Dfs)),
-        ),
-        SolveAlgorithm::Bfs => solve_one(
-            board,
-            Solver::new(SimpleSearchStrategy::new(ExplorerStrategy::Bfs)),
-        ),
+        SolveAlgorithm::Dfs => solve_one(board, Solver::new(DfsSearchStrategy::default())),
+        SolveAlgorithm::Bfs => solve_one(board, Solver::new(BfsSearchStrategy::default())),
         SolveAlgorithm::Heuristic => {
             solve_one(board, Solver::new(HeuristicSearchStrategy::default()));
         }
+        SolveAlgorithm::IdaStar => solve_one(board, IdaStarSolver::default()),
     }
 }
 
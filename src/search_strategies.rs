@@ -3,21 +3,22 @@
 //! This module defines a small strategy trait and a couple of concrete queue
 //! types to drive the solver:
 //!
-//! - `SimpleSearchStrategy` implements FIFO (BFS) or LIFO (DFS) behavior using
-//!   a `LinkedList`, depending on the configured `ExplorerStrategy`.
+//! - `BfsSearchStrategy` implements a FIFO queue over a `VecDeque`.
+//! - `DfsSearchStrategy` implements a LIFO stack over a plain `Vec`.
 //! - `HeuristicSearchStrategy` implements a best-first priority queue using a
-//!   `BinaryHeap`, suitable for A*-like expansions when paired with a type that
-//!   implements `Ord` based on f(n) = g(n)+h(n). In this project we use
-//!   `Reverse<BoardWithSteps>` so that lower cost pops first.
+//!   `BinaryHeap` of single-word packed nodes, suitable for A*-like expansions
+//!   where f(n) = g(n)+h(n). `Reverse` is used so that lower cost pops first.
 //!
-//! The solver is generic over `SearchStrategy<T>`, so new frontier policies can
-//! be plugged in easily.
+//! Each policy is its own type, so the pop discipline is fixed at compile time
+//! and `get_next` never branches on a runtime configuration flag. The solver is
+//! generic over `SearchStrategy<T>`, so new frontier policies can be plugged in
+//! easily.
 use std::{
     cmp::Reverse,
     collections::{BinaryHeap, VecDeque},
 };
 
-use crate::solver::ExplorerStrategy;
+use crate::board::BoardWithSteps;
 
 /// Minimal frontier abstraction used by the solver.
 pub trait SearchStrategy<T> {
@@ -29,51 +30,64 @@ pub trait SearchStrategy<T> {
     fn len(&self) -> usize;
 }
 
-/// A simple FIFO or LIFO queue based on `VecDeque`.
+/// A FIFO queue for breadth-first search.
 #[derive(Default, Clone)]
-pub struct SimpleSearchStrategy<T> {
-    nodes: VecDeque<T>,
-    strategy: ExplorerStrategy,
-}
+pub struct BfsSearchStrategy<T>(VecDeque<T>);
+
+impl<T> SearchStrategy<T> for BfsSearchStrategy<T> {
+    fn get_next(&mut self) -> Option<T> {
+        self.0.pop_front()
+    }
+
+    fn enqueue(&mut self, node: T) {
+        self.0.push_back(node);
+    }
 
-impl<T> SimpleSearchStrategy<T> {
-    /// Create a new simple search strategy with the given algorithm.
-    pub fn new(algorithm: ExplorerStrategy) -> Self {
-        Self {
-            nodes: VecDeque::default(),
-            strategy: algorithm,
-        }
+    fn len(&self) -> usize {
+        self.0.len()
     }
 }
 
-impl<T> SearchStrategy<T> for SimpleSearchStrategy<T> {
+/// A LIFO stack for depth-first search.
+///
+/// Only one end is ever touched, so a plain `Vec` suffices; it skips the
+/// wrap-around index arithmetic a ring buffer pays on every push and pop.
+#[derive(Default, Clone)]
+pub struct DfsSearchStrategy<T>(Vec<T>);
+
+impl<T> SearchStrategy<T> for DfsSearchStrategy<T> {
     fn get_next(&mut self) -> Option<T> {
-        match self.strategy {
-            ExplorerStrategy::Bfs => self.nodes.pop_front(),
-            ExplorerStrategy::Dfs => self.nodes.pop_back(),
-        }
+        self.0.pop()
     }
 
     fn enqueue(&mut self, node: T) {
-        self.nodes.push_back(node);
+        self.0.push(node);
     }
 
     fn len(&self) -> usize {
-        self.nodes.len()
+        self.0.len()
     }
 }
 
-/// A best-first priority queue based on `Ord`.
+/// A best-first priority queue over single-word packed nodes.
+///
+/// Heap entries are the `u64` words produced by [`BoardWithSteps::pack`],
+/// which place the total cost in the most significant bits: every sift
+/// comparison is a plain integer compare and every swap moves one machine
+/// word, instead of shuffling multi-field structs and dispatching to their
+/// `Ord` implementation.
 #[derive(Default, Clone)]
-pub struct HeuristicSearchStrategy<T: Ord + PartialOrd>(BinaryHeap<T>);
+pub struct HeuristicSearchStrategy(BinaryHeap<Reverse<u64>>);
 
-impl<T: Ord + PartialOrd> SearchStrategy<T> for HeuristicSearchStrategy<Reverse<T>> {
-    fn get_next(&mut self) -> Option<T> {
-        self.0.pop().map(|b| b.0)
+impl SearchStrategy<BoardWithSteps> for HeuristicSearchStrategy {
+    fn get_next(&mut self) -> Option<BoardWithSteps> {
+        self.0
+            .pop()
+            .map(|Reverse(word)| BoardWithSteps::unpack(word))
     }
 
-    fn enqueue(&mut self, node: T) {
-        self.0.push(Reverse(node));
+    fn enqueue(&mut self, node: BoardWithSteps) {
+        self.0.push(Reverse(node.pack()));
     }
 
     fn len(&self) -> usize {
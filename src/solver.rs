@@ -1,28 +1,31 @@
 //! # Solver Module
 //!
-//! This module implements the core solver for the 8-puzzle.
-//! It supports multiple frontier strategies, including Depth-First Search (DFS),
-//! Breadth-First Search (BFS), and a heuristic best-first approach when combined
-//! with a priority queue strategy. The solver produces detailed statistics about
-//! the search process.
-use clap::ValueEnum;
-
-use crate::board::{ALL_DIRECTIONS, Board, BoardWithSteps};
+//! This module implements the core solvers for the 8-puzzle.
+//! The frontier-based [`Solver`] supports multiple strategies, including
+//! Depth-First Search (DFS), Breadth-First Search (BFS), and a heuristic
+//! best-first approach when combined with a priority queue strategy.
+//! [`IdaStarSolver`] implements iterative-deepening A*, which trades the
+//! frontier and bookkeeping maps for bounded depth-first probes. Both
+//! produce detailed statistics about the search process through the common
+//! [`PuzzleSolver`] interface.
+use crate::board::{Board, BoardWithSteps, EncodedBoard, MOVES};
 use crate::search_strategies::SearchStrategy;
 use crate::stats::Stats;
 use std::collections::{HashMap, HashSet};
 use std::time::Instant;
 
-/// Search strategy enumeration for the puzzle solver
+/// Common interface shared by the puzzle solvers
 ///
-/// Determines the order in which nodes are explored during the search.
-#[derive(Clone, Copy, Debug, Default, PartialEq, Eq, PartialOrd, Ord, ValueEnum)]
-pub enum ExplorerStrategy {
-    /// Depth-First Search: explores as far as possible along each branch before backtracking
-    Dfs,
-    /// Breadth-First Search: explores all neighbors at the current depth before moving deeper
-    #[default]
-    Bfs,
+/// Abstracts over the frontier-based [`Solver`] and [`IdaStarSolver`] so the
+/// CLI can drive either one: run a search, reconstruct the path, and report
+/// statistics.
+pub trait PuzzleSolver {
+    /// Solves the puzzle, returning the solved board if one is reachable.
+    fn solve(&mut self, board: Board) -> Option<Board>;
+    /// Reconstructs the solution path from start to goal.
+    fn step_by_step_solution(&self) -> Vec<Board>;
+    /// Generates statistics about the last search.
+    fn get_solution_stats(&self) -> Stats;
 }
 
 /// 8-puzzle solver with comprehensive statistics tracking
@@ -36,14 +39,15 @@ where
     T: Default + Clone,
 {
     /// Parent relationships for reconstructing the solution path
-    parents: HashMap<Board, Board>,
-    /// Set of already explored board states
-    boards_checked: HashSet<Board>,
+    parents: HashMap<EncodedBoard, EncodedBoard>,
+    /// Set of every state ever enqueued, used to prune duplicates at
+    /// generation time before they reach the frontier
+    seen: HashSet<EncodedBoard>,
     boards_to_check: T,
-    /// History of frontier sizes throughout the search
-    to_check_size: Vec<usize>,
-    /// Depth of each board state in the search tree
-    depth_by_board: HashMap<Board, usize>,
+    /// Number of states dequeued and expanded
+    nodes_explored: usize,
+    /// Largest frontier size observed during the search
+    max_frontier: usize,
     /// Total number of successor states generated
     generated_nodes: usize,
     /// Total number of states added to the frontier
@@ -73,15 +77,15 @@ where
         self.init_search(board);
         let start = Instant::now();
 
-        while let Some(board) = self.boards_to_check.get_next() {
-            self.mark_explored(board.0);
+        while let Some(node) = self.boards_to_check.get_next() {
+            self.nodes_explored += 1;
             self.record_frontier_size();
 
-            if board.0.is_solved() {
-                return Some(self.finish_with_solution(start, board.0));
+            if node.board.is_solved() {
+                return Some(self.finish_with_solution(start, node.board));
             }
 
-            self.expand_neighbors(&board);
+            self.expand_neighbors(&node);
         }
 
         self.finish_without_solution(start);
@@ -110,14 +114,12 @@ where
     ///
     /// A `Stats` struct containing detailed metrics about the search performance
     pub fn get_solution_stats(&self) -> Stats {
-        let max_frontier = self.to_check_size.iter().copied().max().unwrap_or(0);
-
         let solution_moves = self.step_by_step_solution().len().saturating_sub(1);
 
         Stats {
-            nodes_explored: self.boards_checked.len(),
+            nodes_explored: self.nodes_explored,
             solution_moves,
-            max_frontier,
+            max_frontier: self.max_frontier,
             generated_nodes: self.generated_nodes,
             enqueued_nodes: self.enqueued_nodes,
             duplicates_pruned: self.duplicates_pruned,
@@ -135,12 +137,12 @@ where
     ///
     /// A vector of board states representing the solution path
     pub fn step_by_step_solution(&self) -> Vec<Board> {
-        let mut c = Board::default();
-        let mut solution = vec![c];
+        let mut c = Board::default().encoded();
+        let mut solution = vec![Board::from_encoded(c)];
 
-        while let Some(nc) = self.parents.get(&c) {
-            solution.push(*nc);
-            c = *nc;
+        while let Some(&nc) = self.parents.get(&c) {
+            solution.push(Board::from_encoded(nc));
+            c = nc;
         }
 
         solution.reverse();
@@ -153,22 +155,18 @@ where
     ///
     /// * `start` - The initial board state to begin searching from
     fn init_search(&mut self, start: Board) {
-        self.boards_to_check.enqueue(BoardWithSteps(start, 0));
-        self.depth_by_board.insert(start, 0);
+        self.seen.insert(start.encoded());
+        self.boards_to_check
+            .enqueue(BoardWithSteps::new(start, 0, None));
     }
 
     /// Records the current frontier size for statistics
-    fn record_frontier_size(&mut self) {
-        self.to_check_size.push(self.boards_to_check.len());
-    }
-
-    /// Marks a board as explored to avoid revisiting it
-    ///
-    /// # Arguments
     ///
-    /// * `board` - The board state to mark as explored
-    fn mark_explored(&mut self, board: Board) {
-        self.boards_checked.insert(board);
+    /// Only the running maximum is kept; storing the full history would grow
+    /// a list proportional to the number of nodes explored just to take its
+    /// maximum at the end.
+    fn record_frontier_size(&mut self) {
+        self.max_frontier = self.max_frontier.max(self.boards_to_check.len());
     }
 
     /// Completes the search when a solution is found
@@ -205,11 +203,11 @@ where
     /// * `child` - The successor board state to enqueue
     fn enqueue_successor(&mut self, parent: &BoardWithSteps, child: BoardWithSteps) {
         self.enqueued_nodes += 1;
-        self.parents.insert(child.0, parent.0);
+        self.parents
+            .insert(child.board.encoded(), parent.board.encoded());
 
-        let parent_depth = *self.depth_by_board.get(&parent.0).unwrap_or(&0);
-        let depth = parent_depth + 1;
-        self.depth_by_board.insert(child.0, depth);
+        // The child's depth is already carried on the frontier node itself.
+        let depth = parent.steps + 1;
 
         if depth > self.max_depth_reached {
             self.max_depth_reached = depth;
@@ -218,36 +216,198 @@ where
         self.boards_to_check.enqueue(child);
     }
 
-    /// Processes a single move attempt from a parent board
+    /// Processes a single move from a parent board
     ///
-    /// Generates a successor state and either enqueues it or records it as a duplicate.
+    /// Generates a successor state and either enqueues it or records it as a
+    /// duplicate. States already seen — whether still waiting on the frontier
+    /// or long since expanded — are pruned here, before they can inflate the
+    /// frontier. With a consistent heuristic the first path that reaches a
+    /// state is already optimal, so dropping later copies is safe.
     ///
     /// # Arguments
     ///
     /// * `parent` - The parent board state
-    /// * `dir` - The direction to move the empty space
-    fn process_move(&mut self, parent: &BoardWithSteps, dir: crate::board::Direction) {
-        if let Ok(child) = parent.0.move_space(dir) {
-            self.generated_nodes += 1;
-            if self.boards_checked.contains(&child) {
-                self.duplicates_pruned += 1;
-            } else {
-                self.enqueue_successor(parent, BoardWithSteps(child, parent.1 + 1));
-            }
+    /// * `space_new_position` - The (precomputed, known-valid) destination of the space
+    fn process_move(&mut self, parent: &BoardWithSteps, space_new_position: u8) {
+        let child = parent.board.move_space_to(space_new_position);
+
+        self.generated_nodes += 1;
+        if self.seen.insert(child.encoded()) {
+            let previous_space = Some(parent.board.space_position());
+            self.enqueue_successor(
+                parent,
+                BoardWithSteps::new(child, parent.steps + 1, previous_space),
+            );
+        } else {
+            self.duplicates_pruned += 1;
         }
     }
 
     /// Expands all possible successor states from the current board
     ///
-    /// Attempts to move the empty space in all four directions to generate
-    /// all valid successor states.
+    /// Iterates the precomputed legal moves for the current space position,
+    /// so only valid successors are ever generated. Moving the space back to
+    /// where it came from would regenerate the parent state, so that move is
+    /// skipped outright instead of being generated and pruned.
     ///
     /// # Arguments
     ///
     /// * `board` - The current board state to expand
-    fn expand_neighbors(&mut self, board: &BoardWithSteps) {
-        for direction in &ALL_DIRECTIONS {
-            self.process_move(board, *direction);
+    fn expand_neighbors(&mut self, node: &BoardWithSteps) {
+        for &(_, space_new_position) in &MOVES[usize::from(node.board.space_position())] {
+            if Some(space_new_position) == node.previous_space {
+                continue;
+            }
+
+            self.process_move(node, space_new_position);
+        }
+    }
+}
+
+impl<T> PuzzleSolver for Solver<T>
+where
+    T: SearchStrategy<BoardWithSteps> + Default + Clone,
+{
+    fn solve(&mut self, board: Board) -> Option<Board> {
+        Solver::solve(self, board)
+    }
+
+    fn step_by_step_solution(&self) -> Vec<Board> {
+        Solver::step_by_step_solution(self)
+    }
+
+    fn get_solution_stats(&self) -> Stats {
+        Solver::get_solution_stats(self)
+    }
+}
+
+/// Outcome of one bounded depth-first probe of the IDA* search
+enum ProbeOutcome {
+    /// The goal was reached; the solver's path holds the solution
+    Found,
+    /// The subtree was exhausted; carries the smallest f-value that
+    /// exceeded the bound, to use as the next iteration's threshold
+    Exceeded(usize),
+}
+
+/// Longest optimal solution over all solvable 8-puzzle boards
+///
+/// The diameter of the solvable half of the state space is 31 moves, so a
+/// probe bound past it can only be produced by a board in the other,
+/// unsolvable orbit.
+const IDA_STAR_MAX_BOUND: usize = 31;
+
+/// Iterative-deepening A* solver for the 8-puzzle
+///
+/// Runs a sequence of depth-first probes bounded by increasing
+/// `f(n) = g(n) + h(n)` thresholds, starting at the root's heuristic value.
+/// There is no frontier, no seen set, and no parent map: memory use is
+/// O(solution depth) for the recursion path, instead of the O(b^d)
+/// bookkeeping of the frontier-based solver. With the admissible Manhattan
+/// heuristic the first solution found is optimal.
+#[derive(Default, Clone)]
+pub struct IdaStarSolver {
+    /// Boards on the current depth-first path, root first; after a
+    /// successful solve this is the solution path
+    path: Vec<Board>,
+    /// Total number of successor states generated
+    generated_nodes: usize,
+    /// Number of states visited across all probes (re-expansions included)
+    nodes_explored: usize,
+    /// Maximum depth reached during the search
+    max_depth_reached: usize,
+    /// Time taken to solve the puzzle in milliseconds
+    solve_duration_ms: u128,
+}
+
+impl IdaStarSolver {
+    /// One bounded depth-first probe from the node on top of `path`
+    ///
+    /// # Arguments
+    ///
+    /// * `steps` - Depth of the current node (g-cost)
+    /// * `bound` - Current f-value threshold
+    /// * `previous_space` - Space position before the move that produced
+    ///   this node, skipped during expansion to avoid regenerating the parent
+    fn probe(&mut self, steps: usize, bound: usize, previous_space: Option<u8>) -> ProbeOutcome {
+        let board = *self.path.last().expect("Path holds the current node");
+        let cost = steps + usize::from(board.heuristic_distance_to_solution());
+
+        if cost > bound {
+            return ProbeOutcome::Exceeded(cost);
+        }
+
+        self.nodes_explored += 1;
+        self.max_depth_reached = self.max_depth_reached.max(steps);
+
+        if board.is_solved() {
+            return ProbeOutcome::Found;
+        }
+
+        let mut next_bound = usize::MAX;
+
+        for &(_, space_new_position) in &MOVES[usize::from(board.space_position())] {
+            if Some(space_new_position) == previous_space {
+                continue;
+            }
+
+            self.generated_nodes += 1;
+            self.path.push(board.move_space_to(space_new_position));
+
+            match self.probe(steps + 1, bound, Some(board.space_position())) {
+                ProbeOutcome::Found => return ProbeOutcome::Found,
+                ProbeOutcome::Exceeded(f) => next_bound = next_bound.min(f),
+            }
+
+            self.path.pop();
+        }
+
+        ProbeOutcome::Exceeded(next_bound)
+    }
+}
+
+impl PuzzleSolver for IdaStarSolver {
+    fn solve(&mut self, board: Board) -> Option<Board> {
+        let start = Instant::now();
+        let mut bound = usize::from(board.heuristic_distance_to_solution());
+
+        loop {
+            self.path.clear();
+            self.path.push(board);
+
+            match self.probe(0, bound, None) {
+                ProbeOutcome::Found => {
+                    self.solve_duration_ms = start.elapsed().as_millis();
+                    return Some(*self.path.last().expect("Path holds the solved board"));
+                }
+                // A bound beyond the state-space diameter means the board
+                // sits in the unsolvable orbit; without this cap the probes
+                // would raise the bound forever, since every probe generates
+                // at least one child and so always yields a finite f-value.
+                ProbeOutcome::Exceeded(next_bound) if next_bound > IDA_STAR_MAX_BOUND => {
+                    self.solve_duration_ms = start.elapsed().as_millis();
+                    return None;
+                }
+                ProbeOutcome::Exceeded(next_bound) => bound = next_bound,
+            }
+        }
+    }
+
+    fn step_by_step_solution(&self) -> Vec<Board> {
+        self.path.clone()
+    }
+
+    fn get_solution_stats(&self) -> Stats {
+        Stats {
+            nodes_explored: self.nodes_explored,
+            solution_moves: self.path.len().saturating_sub(1),
+            // The only memory held during the search is the current path.
+            max_frontier: self.max_depth_reached + 1,
+            generated_nodes: self.generated_nodes,
+            enqueued_nodes: self.generated_nodes,
+            duplicates_pruned: 0,
+            max_depth_reached: self.max_depth_reached,
+            duration_ms: self.solve_duration_ms,
         }
     }
 }
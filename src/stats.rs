@@ -202,25 +202,20 @@ fn print_percentile_section<'a>(
     println!("{t}\n");
 }
 
-/// Prints a formatted comparison table of two search strategies
+/// Prints a formatted comparison table of search strategies
 ///
 /// Displays a comprehensive side-by-side comparison of performance metrics
-/// for two different search strategies (typically DFS vs BFS).
+/// for any number of named strategies.
 ///
 /// # Arguments
 ///
-/// * `left` - Statistics summary for the first strategy
-/// * `right` - Statistics summary for the second strategy
-pub fn print_comparison_table(left: &StatsSummary, right: &StatsSummary, other: &StatsSummary) {
-    let title = format!(
-        "Strategy Comparison (runs: {}, Dfs vs Bfs vs Heuristic)",
-        left.runs
-    );
+/// * `strategies` - Name and statistics summary for each strategy compared
+pub fn print_comparison_table(strategies: &[(&str, StatsSummary)]) {
+    let runs = strategies.first().map_or(0, |(_, summary)| summary.runs);
+    let names: Vec<&str> = strategies.iter().map(|&(name, _)| name).collect();
+    let title = format!("Strategy Comparison (runs: {runs}, {})", names.join(" vs "));
     println!("\n{title}\n");
 
-    let strategies: [(&str, &StatsSummary); 3] =
-        [("DFS", left), ("BFS", right), ("Heuristic", other)];
-
     // Descriptor: label, description, accessor to metric in a StatsSummary
     let sections: [SectionDesc; 8] = [
         (
@@ -266,9 +261,7 @@ pub fn print_comparison_table(left: &StatsSummary, right: &StatsSummary, other:
     ];
 
     for (label, desc, accessor) in sections {
-        let rows = strategies
-            .into_iter()
-            .map(|(name, ss)| (name, accessor(ss)));
+        let rows = strategies.iter().map(|(name, ss)| (*name, accessor(ss)));
         print_percentile_section(label, desc, rows);
     }
 